@@ -1,62 +1,191 @@
+import atexit
+import bisect
+import hashlib
+import itertools
 import json
 import os
-import platform
+import queue
 import re
+import shlex
 import shutil
+import string
 import subprocess
+import sys
+import tempfile
 import threading
 import time
 import tkinter as tk
 import tkinter.font as tkfont
-import urllib.request
-import webbrowser
-import zipfile
-from tkinter import messagebox, scrolledtext, simpledialog
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from operator import itemgetter
+from tkinter import messagebox, ttk
+
+# orjson serializes noticeably faster; fall back to ujson, then the standard library
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    try:
+        import ujson as _fallback_json
+    except ImportError:
+        _fallback_json = json
+
+    def _json_dumps(obj):
+        return _fallback_json.dumps(obj).encode("utf-8")
+
+    _json_loads = _fallback_json.loads
 
 # Directory constants
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 SCRIPTS_DIR = os.path.join(BASE_DIR, "scripts")
 ENVS_DIR = os.path.join(BASE_DIR, "environments")
+ARCHIVED_SCRIPTS_DIR = os.path.join(BASE_DIR, "archived_scripts")
+ARCHIVED_ENVS_DIR = os.path.join(BASE_DIR, "archived_environments")
+# Wheel cache shared by every script environment
+PIP_CACHE_DIR = os.path.join(BASE_DIR, ".pip-cache")
+# Lines of pip output shown when installing requirements fails
+PIP_ERROR_TAIL_LINES = 20
+# Environments created at once by a batch setup
+VENV_SETUP_WORKERS = min(8, os.cpu_count() or 1)
 
 # Ensure directories exist
 os.makedirs(SCRIPTS_DIR, exist_ok=True)
 os.makedirs(ENVS_DIR, exist_ok=True)
+os.makedirs(ARCHIVED_SCRIPTS_DIR, exist_ok=True)
+os.makedirs(ARCHIVED_ENVS_DIR, exist_ok=True)
 
 METADATA_FILE = os.path.join(BASE_DIR, "script_metadata.json")
+PROMPT_FILE = os.path.join(BASE_DIR, "prompt.txt")
 script_metadata = {}
+
+# Python version -> interpreter path resolved through `pyenv which`, persisted in the
+# metadata file under PYENV_PATHS_KEY so later sessions skip the subprocess too
+PYENV_PATHS_KEY = "_pyenv_paths"
+_pyenv_path_cache = {}
 run_buttons = {}
+script_frames = {}
+last_run_labels = {}
+
+# Compiled prompt.txt template, keyed by modification time
+_prompt_cache = {"mtime": 0, "fill": None}
+
+# Per-script .env paths, filled in lazily by dotenv_path
+_dotenv_path_cache = {}
+
+# Per-script (venv Python, main.py) paths, filled in lazily by script_run_paths
+_run_paths_cache = {}
+
+# Header written to new .env files, pre-encoded once
+DEFAULT_ENV_BYTES = (
+    "# This is where you should define environment variables, if necessary.\n"
+    "# For example, it might look like:\n"
+    '# OPENAI_KEY="secret-openai-key-here"\n'
+    '# API_TOKEN="your-api-token"\n\n'
+).encode("utf-8")
+
+# Editors load files into their Text widget in chunks of this many characters
+FILE_CHUNK_SIZE = 65536
+
+# Initial window sizes
+EDITOR_GEOMETRY = "600x400"
+CONTENT_INPUT_GEOMETRY = "600x600"
+PROMPT_GEOMETRY = "500x400"
+INSTALL_PYENV_GEOMETRY = "500x300"
+
+# Script Terminal.app runs on macOS to launch a script. One is kept per environment
+# (as MAC_LAUNCHER_NAME inside it), written the first time the script is run.
+MAC_LAUNCHER_TEMPLATE = "#!/bin/bash\necho {banner}\necho\necho\n{python} {script}\n"
+MAC_LAUNCHER_NAME = "run_script.command"
+
+# Pending metadata write state (see save_metadata)
+METADATA_SAVE_DELAY_MS = 2000
+_metadata_dirty = False
+_metadata_after_id = None
+
+# Status label updates are coalesced: only the latest one within this window is drawn
+STATUS_FLUSH_MS = 30
+_pending_status = {"text": None, "fg": None, "scheduled": False}
+
+# Script -> last run time as of the last list refresh, to skip no-op redraws
+_last_snapshot = {}
+
+# Script the shared context menu (CONTEXT_MENU) was last opened for
+_active_script = None
+
+# Long-running work runs on a small pool of background workers, which bounds how
+# many setups (and pip processes) run at once. Workers never touch Tk directly:
+# they post callbacks to _ui_queue, which the main loop drains in batches.
+BACKGROUND_WORKERS = 2
+_background_executor = ThreadPoolExecutor(
+    max_workers=BACKGROUND_WORKERS, thread_name_prefix="background"
+)
+_ui_queue = queue.Queue()
+UI_QUEUE_POLL_MS = 100
+
+# Script rows are rendered in batches; a refresh bumps the generation to
+# cancel batches still pending from an earlier refresh
+RENDER_BATCH_SIZE = 20
+_render_generation = 0
+
+# Platform constants
+IS_WINDOWS = sys.platform == "win32"
+IS_MAC = sys.platform == "darwin"
+IS_LINUX = sys.platform.startswith("linux")
+
+# pyenv locations (pyenv-win keeps its tree one level deeper)
+if IS_WINDOWS:
+    PYENV_ROOT = os.path.join(os.path.expanduser("~"), ".pyenv", "pyenv-win")
+else:
+    PYENV_ROOT = os.path.join(os.path.expanduser("~"), ".pyenv")
+PYENV_BIN = os.path.join(PYENV_ROOT, "bin")
+PYENV_SHIMS = os.path.join(PYENV_ROOT, "shims")
+PYENV_EXECUTABLE = os.path.join(PYENV_BIN, "pyenv.bat" if IS_WINDOWS else "pyenv")
+
+# pyenv version list cache, so repeated setups skip `pyenv install --list`
+VERSIONS_CACHE_TTL = 300  # seconds
+_versions_cache = {"data": None, "ts": 0}
+_prefix_cache = {}
+_version_key_cache = {}
+
+# Distributions we never offer as a script runtime
+EXCLUDED_VERSION_RE = re.compile(r"Anaconda|Stackless|Miniconda|MicroPython|PyPy|-win32")
 
 # Load metadata from the file
 if os.path.exists(METADATA_FILE):
-    with open(METADATA_FILE, "r", encoding="utf-8") as metadata_file:
-        script_metadata = json.load(metadata_file)
+    with open(METADATA_FILE, "rb") as metadata_file:
+        script_metadata = _json_loads(metadata_file.read())
+    _pyenv_path_cache = script_metadata.pop(PYENV_PATHS_KEY, {})
 
 
 def add_pyenv_to_path():
     """Ensure pyenv is accessible by adding it to PATH."""
-    home_dir = os.path.expanduser("~")
-    system = platform.system()
-
-    if system == "Windows":
-        pyenv_root = os.path.join(home_dir, ".pyenv", "pyenv-win")
-        pyenv_bin = os.path.join(pyenv_root, "bin")
-        pyenv_shims = os.path.join(pyenv_root, "shims")
-    else:
-        pyenv_root = os.path.join(home_dir, ".pyenv")
-        pyenv_bin = os.path.join(pyenv_root, "bin")
-        pyenv_shims = os.path.join(pyenv_root, "shims")
-
     # Add pyenv directories to PATH if not already present
     path_dirs = os.environ["PATH"].split(os.pathsep)
-    if pyenv_bin not in path_dirs:
-        path_dirs.insert(0, pyenv_bin)
-    if pyenv_shims not in path_dirs:
-        path_dirs.insert(0, pyenv_shims)
+    if PYENV_BIN not in path_dirs:
+        path_dirs.insert(0, PYENV_BIN)
+    if PYENV_SHIMS not in path_dirs:
+        path_dirs.insert(0, PYENV_SHIMS)
     os.environ["PATH"] = os.pathsep.join(path_dirs)
 
 
 add_pyenv_to_path()
 
+# Environment for subprocesses that need extra variables, copied once with pyenv on PATH
+_BASE_ENV = dict(os.environ)
+
+# uv, when installed, creates environments and installs requirements much faster than
+# venv and pip. pyenv shims are skipped: a uv shim only works under some Python versions.
+UV_EXECUTABLE = shutil.which(
+    "uv",
+    path=os.pathsep.join(
+        path_dir for path_dir in _BASE_ENV["PATH"].split(os.pathsep) if path_dir != PYENV_SHIMS
+    ),
+)
+
 
 def check_for_updates():
     """
@@ -94,8 +223,10 @@ def check_for_updates():
                 # Either not a Git repo, or Git is not installed, or another error
                 return False
 
-            messagebox.showinfo(
-                "Update", f"Git pull completed:\n\n{result.stdout.strip() or 'No changes.'}"
+            post_to_ui(
+                messagebox.showinfo,
+                "Update",
+                f"Git pull completed:\n\n{result.stdout.strip() or 'No changes.'}",
             )
             return True
         except FileNotFoundError:
@@ -103,22 +234,28 @@ def check_for_updates():
             return False
         except Exception as e:
             # Other errors
-            messagebox.showerror("Update Error", f"Git update failed:\n{e}")
+            post_to_ui(messagebox.showerror, "Update Error", f"Git update failed:\n{e}")
             return False
 
-    def do_zip_update():
-        """
-        Download the ZIP from GitHub and replace files in BASE_DIR,
-        except user scripts or anything you'd like to keep excluded.
-        """
+    def confirm_zip_update():
+        """Ask whether to fall back to the ZIP update, and start it if confirmed."""
         # Ask the user to confirm overwriting
         confirm = messagebox.askyesno(
             "Confirm Update",
             "Git update failed or not available.\n\n"
             "Proceed with ZIP-based update from GitHub? This will overwrite base files.",
         )
-        if not confirm:
-            return
+        if confirm:
+            threading.Thread(target=do_zip_update).start()
+
+    def do_zip_update():
+        """
+        Download the ZIP from GitHub and replace files in BASE_DIR,
+        except user scripts or anything you'd like to keep excluded.
+        """
+        # Only needed for this fallback, so imported here to keep startup lean
+        import urllib.request
+        import zipfile
 
         # Download the ZIP to a temporary file
         try:
@@ -159,30 +296,103 @@ def check_for_updates():
             os.remove(tmp_zip_path)
             shutil.rmtree(tmp_extract_dir)
 
-            messagebox.showinfo("Update", "ZIP-based update completed successfully.")
+            post_to_ui(messagebox.showinfo, "Update", "ZIP-based update completed successfully.")
         except Exception as e:
-            messagebox.showerror("Update Error", f"ZIP-based update failed:\n{e}")
+            post_to_ui(messagebox.showerror, "Update Error", f"ZIP-based update failed:\n{e}")
+
+    def run_update():
+        # First, try the Git update
+        if not do_git_update():
+            # If Git update fails, offer the ZIP update (the prompt runs on the Tk thread)
+            post_to_ui(confirm_zip_update)
 
-    # First, try the Git update
-    if not do_git_update():
-        # If Git update fails, do ZIP update
-        do_zip_update()
+    # The network and git work runs on its own thread so the UI stays responsive. It is
+    # not queued behind run_in_background jobs, which can take minutes.
+    threading.Thread(target=run_update).start()
 
 
 def save_metadata():
-    """Save the metadata to the JSON file."""
-    with open(METADATA_FILE, "w", encoding="utf-8") as metadata_json_file:
-        json.dump(script_metadata, metadata_json_file)
+    """Schedule saving the metadata, so bursts of changes result in a single write."""
+    global _metadata_dirty, _metadata_after_id
+    _metadata_dirty = True
+    if _metadata_after_id is None:
+        _metadata_after_id = root.after(METADATA_SAVE_DELAY_MS, flush_metadata)
+
+
+def flush_metadata():
+    """Write pending metadata changes to the JSON file, replacing it atomically."""
+    global _metadata_dirty, _metadata_after_id
+    _metadata_after_id = None
+    if not _metadata_dirty:
+        return
+
+    tmp_file = METADATA_FILE + ".tmp"
+    with open(tmp_file, "wb") as metadata_json_file:
+        metadata_json_file.write(
+            _json_dumps({**script_metadata, PYENV_PATHS_KEY: _pyenv_path_cache})
+        )
+    os.replace(tmp_file, METADATA_FILE)
+    _metadata_dirty = False
+
+
+def close_app():
+    """Write any pending metadata, then close the main window."""
+    flush_metadata()
+    root.destroy()
+
+
+def run_in_background(job):
+    """Queue a callable to run on the background worker pool."""
+    _background_executor.submit(run_background_job, job)
+
+
+def run_background_job(job):
+    """Run a queued job; jobs report their own errors via post_to_ui."""
+    try:
+        job()
+    except Exception as e:
+        post_to_ui(messagebox.showerror, "Error", f"Background task failed:\n{e}")
+
+
+def post_to_ui(func, *args):
+    """Schedule func(*args) on the Tk main thread. Safe to call from any thread."""
+    _ui_queue.put((func, args))
+
+
+def drain_ui_queue():
+    """Run every callback posted from background work, then poll again shortly."""
+    root.after(UI_QUEUE_POLL_MS, drain_ui_queue)
+    while True:
+        try:
+            func, args = _ui_queue.get_nowait()
+        except queue.Empty:
+            return
+        func(*args)
+
+
+def get_installed_python_path(python_version):
+    """Return the expected interpreter path for a pyenv-installed Python version."""
+    version_dir = os.path.join(PYENV_ROOT, "versions", python_version)
+    if IS_WINDOWS:
+        return os.path.join(version_dir, "python.exe")
+    return os.path.join(version_dir, "bin", "python3")
 
 
 def get_pyenv_python_path(python_version):
     """Get the path to the pyenv-managed Python executable."""
-    try:
-        system = platform.system()
-        env = os.environ.copy()
-        env["PYENV_VERSION"] = python_version
+    # Read the interpreter straight from the pyenv tree when possible,
+    # since every pyenv invocation pays the shim startup cost
+    candidate = get_installed_python_path(python_version)
+    if os.path.isfile(candidate):
+        return candidate
+
+    # Reuse an earlier `pyenv which` answer while the interpreter is still there
+    cached_path = _pyenv_path_cache.get(python_version)
+    if cached_path and os.path.isfile(cached_path):
+        return cached_path
 
-        if system == "Windows":
+    try:
+        if IS_WINDOWS:
             command = "pyenv which python"
             shell = True
         else:
@@ -196,7 +406,7 @@ def get_pyenv_python_path(python_version):
             command_list,
             capture_output=True,
             text=True,
-            env=env,
+            env={**_BASE_ENV, "PYENV_VERSION": python_version},
             shell=shell,
             check=False,
         )
@@ -207,7 +417,10 @@ def get_pyenv_python_path(python_version):
                 f"STDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}"
             )
             raise RuntimeError(error_message)
-        return result.stdout.strip()
+        python_path = result.stdout.strip()
+        _pyenv_path_cache[python_version] = python_path
+        post_to_ui(save_metadata)
+        return python_path
     except FileNotFoundError as exc:
         raise FileNotFoundError("pyenv is not installed or not in PATH.") from exc
     except Exception as exc:
@@ -217,11 +430,18 @@ def get_pyenv_python_path(python_version):
 
 
 def get_available_python_versions():
-    """Get the list of available Python versions from pyenv."""
+    """
+    Get the lexicographically sorted list of available Python versions from pyenv,
+    cached for a few minutes.
+    """
+    if (
+        _versions_cache["data"] is not None
+        and time.time() - _versions_cache["ts"] < VERSIONS_CACHE_TTL
+    ):
+        return _versions_cache["data"]
+
     try:
-        system = platform.system()
-        env = os.environ.copy()
-        if system == "Windows":
+        if IS_WINDOWS:
             command = "pyenv install --list"
             shell = True
         else:
@@ -232,7 +452,6 @@ def get_available_python_versions():
             command,
             capture_output=True,
             text=True,
-            env=env,
             shell=shell,
             check=False,
         )
@@ -242,54 +461,70 @@ def get_available_python_versions():
                 f"Failed to get available Python versions.\nSTDERR:\n{result.stderr}"
             )
 
-        versions = result.stdout.strip().splitlines()
-        # Clean up version strings
-        cleaned_versions = []
-        for v in versions:
-            v = v.strip()
-            # Skip empty lines and comments
-            if not v or v.startswith("#"):
-                continue
-
-            if any(
-                keyword in v
-                for keyword in [
-                    "Anaconda",
-                    "Stackless",
-                    "Miniconda",
-                    "MicroPython",
-                    "PyPy",
-                    "-win32",
-                ]
-            ):
-                continue
-
-            cleaned_versions.append(v)
+        # Clean up version strings, skipping empty lines, comments and excluded distributions
+        cleaned_versions = [
+            v
+            for v in (line.strip() for line in result.stdout.splitlines())
+            if v and v[0] != "#" and not EXCLUDED_VERSION_RE.search(v)
+        ]
+        # Sorted so that versions sharing a prefix can be found with a bisect
+        cleaned_versions.sort()
+
+        # Fresh list, so previously resolved prefixes may be out of date
+        _versions_cache["data"] = cleaned_versions
+        _versions_cache["ts"] = time.time()
+        _prefix_cache.clear()
         return cleaned_versions
     except Exception as e:
         raise RuntimeError(f"Error fetching available Python versions: {e}")
 
 
+def invalidate_python_version_caches():
+    """Forget cached pyenv version lookups, e.g. after installing a new Python."""
+    _versions_cache["data"] = None
+    _versions_cache["ts"] = 0
+    _prefix_cache.clear()
+
+
+def get_stable_version_key(version):
+    """
+    Return the numeric components of a stable version string as a sort key,
+    or None for pre-release/development versions. Results are memoized.
+    """
+    if version not in _version_key_cache:
+        key = None
+        # Skip versions with pre-release or development suffixes
+        if not re.search(r"(a|b|rc|dev|alpha|beta|t)", version, re.IGNORECASE):
+            # Attempt to parse the version into numeric components
+            version_numbers = re.findall(r"\d+", version)
+            if version_numbers:
+                key = tuple(int(num) for num in version_numbers)
+        _version_key_cache[version] = key
+    return _version_key_cache[version]
+
+
 def get_latest_available_python_version(prefix):
     """Get the latest available Python version matching the given prefix."""
     try:
         versions = get_available_python_versions()
-        # Filter versions that start with the prefix
-        matching_versions = [v for v in versions if v.startswith(prefix)]
+        if prefix in _prefix_cache:
+            return _prefix_cache[prefix]
+
+        # Versions starting with the prefix form a contiguous run in the sorted list
+        matching_versions = []
+        for v in itertools.islice(versions, bisect.bisect_left(versions, prefix), None):
+            if not v.startswith(prefix):
+                break
+            matching_versions.append(v)
         if not matching_versions:
             raise ValueError(f"No available Python versions found matching '{prefix}'.")
 
         # Remove pre-release and development versions
         stable_versions = []
         for v in matching_versions:
-            # Skip versions with pre-release or development suffixes
-            if re.search(r"(a|b|rc|dev|alpha|beta|t)", v, re.IGNORECASE):
-                continue
-            # Attempt to parse the version into numeric components
-            version_numbers = re.findall(r"\d+", v)
-            if not version_numbers:
-                continue  # Skip if no numeric parts found
-            stable_versions.append((v, [int(num) for num in version_numbers]))
+            version_key = get_stable_version_key(v)
+            if version_key is not None:
+                stable_versions.append((v, version_key))
 
         if not stable_versions:
             raise ValueError(f"No stable Python versions found matching '{prefix}'.")
@@ -297,117 +532,261 @@ def get_latest_available_python_version(prefix):
         # Sort the versions based on numeric components
         stable_versions.sort(key=lambda x: x[1])
         latest_version = stable_versions[-1][0]
+        _prefix_cache[prefix] = latest_version
         return latest_version
     except Exception as e:
         raise RuntimeError(f"Error finding latest Python version matching '{prefix}': {e}")
 
 
+def report_setup_error(error):
+    """Show a virtual environment setup error, offering to install pyenv if it is missing."""
+    error_message = str(error)
+    post_to_ui(messagebox.showerror, "Error", error_message)
+    # Only prompt to install pyenv if the error suggests it's not installed
+    if "pyenv is not installed" in error_message or "pyenv: command not found" in error_message:
+        post_to_ui(install_pyenv)
+
+
+def resolve_python(python_version_input):
+    """
+    Resolve a version spec to a pyenv-managed interpreter, installing it if needed.
+    Returns the resolved version and the path to its Python executable. Raises
+    RuntimeError if no available version matches the spec.
+    """
+    # Get the latest available Python version matching the user's input
+    python_version = get_latest_available_python_version(python_version_input)
+    post_to_ui(set_status, f"Using Python {python_version}")
+
+    # Check if the requested Python version is installed. An interpreter in
+    # the pyenv tree settles it without spawning `pyenv versions`, and
+    # get_pyenv_python_path below reads that same path directly.
+    installed = os.path.isfile(
+        get_installed_python_path(python_version)
+    ) or is_python_version_installed(python_version)
+    if not installed:
+        # Install the Python version
+        post_to_ui(
+            set_status,
+            f"Installing Python {python_version} via pyenv... (this may take a while)",
+        )
+        if IS_WINDOWS:
+            command = f"pyenv install {python_version}"
+            shell = True
+        else:
+            command = ["pyenv", "install", python_version]
+            shell = False
+
+        # Stream the build output into the status bar instead of holding it
+        # all in memory, keeping only the tail for the error message
+        output_tail = deque(maxlen=512)
+        with subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            shell=shell,
+        ) as process:
+            for line in process.stdout:
+                output_tail.append(line)
+                if line.strip():
+                    post_to_ui(set_status, line.strip()[:80])
+
+        if process.returncode != 0:
+            error_message = (
+                f"Failed to install Python {python_version} via pyenv.\n"
+                f"Command output:\n{''.join(output_tail)}"
+            )
+            raise RuntimeError(error_message)
+
+        invalidate_python_version_caches()
+        post_to_ui(set_status, f"Successfully installed Python {python_version} via pyenv.")
+
+    # Get the pyenv-managed Python executable
+    python_executable = get_pyenv_python_path(python_version)
+    if not python_executable:
+        raise FileNotFoundError(f"Could not find Python {python_version}")
+
+    return python_version, python_executable
+
+
+def create_venv(script_name, python_executable):
+    """Create a script's virtual environment if missing or broken and install its requirements."""
+    env_path = os.path.join(ENVS_DIR, script_name)
+    requirements_file = os.path.join(SCRIPTS_DIR, script_name, "requirements.txt")
+
+    post_to_ui(set_status, f"Creating virtual environment for {script_name}...")
+    # Create the virtual environment. --seed installs pip into uv-created environments
+    # too, so they keep working if uv goes away.
+    if not has_venv(script_name):
+        # A leftover env whose Python is gone (e.g. its pyenv version was removed) is rebuilt
+        if os.path.exists(env_path):
+            shutil.rmtree(env_path)
+        if UV_EXECUTABLE:
+            venv_command = [
+                UV_EXECUTABLE,
+                "venv",
+                "--seed",
+                "--python",
+                python_executable,
+                env_path,
+            ]
+        else:
+            venv_command = [python_executable, "-m", "venv", env_path]
+        subprocess.run(venv_command, check=True)
+
+    if UV_EXECUTABLE:
+        venv_python, _ = script_run_paths(script_name)
+        install_command = [UV_EXECUTABLE, "pip", "install", "--python", venv_python]
+    else:
+        # Determine the path to pip in the virtual environment
+        if IS_WINDOWS:
+            pip_executable = os.path.join(env_path, "Scripts", "pip.exe")
+        else:
+            pip_executable = os.path.join(env_path, "bin", "pip")
+
+        # Skip .pyc compilation and pip's self-update check, prefer wheels over
+        # building sdists, never block on a prompt, and reuse downloaded wheels
+        # across environments
+        install_command = [
+            pip_executable,
+            "install",
+            "--no-compile",
+            "--disable-pip-version-check",
+            "--prefer-binary",
+            "--no-input",
+            "--cache-dir",
+            PIP_CACHE_DIR,
+        ]
+
+    post_to_ui(set_status, f"Installing requirements for {script_name}...")
+    # Output goes to a temporary file rather than a pipe, and is only read on failure
+    with tempfile.TemporaryFile() as pip_output:
+        result = subprocess.run(
+            install_command + ["-r", requirements_file],
+            stdout=pip_output,
+            stderr=subprocess.STDOUT,
+        )
+        if result.returncode != 0:
+            pip_output.seek(0)
+            output_lines = pip_output.read().decode("utf-8", errors="replace").splitlines()
+            raise RuntimeError(
+                f"Failed to install requirements for {script_name}.\n"
+                "Command output:\n" + "\n".join(output_lines[-PIP_ERROR_TAIL_LINES:])
+            )
+
+
 def setup_venv(script_name, python_version_input="3", run_button=None):
     """Set up a virtual environment for the script using pyenv-managed Python."""
-    env_path = os.path.join(ENVS_DIR, script_name)
-    script_path = os.path.join(SCRIPTS_DIR, script_name)
-    requirements_file = os.path.join(script_path, "requirements.txt")
 
     def run_setup():
         # Disable the Run button and update the status
         if run_button:
-            root.after(0, run_button.config, {"state": "disabled"})
-        set_status("Setting up virtual environment...")
-
-        def handle_error(error):
-            error_message = str(error)
-            root.after(0, lambda: messagebox.showerror("Error", error_message))
-            # Only prompt to install pyenv if the error suggests it's not installed
-            if (
-                "pyenv is not installed" in error_message
-                or "pyenv: command not found" in error_message
-            ):
-                root.after(0, install_pyenv)
+            post_to_ui(run_button.config, {"state": "disabled"})
+        post_to_ui(set_status, "Setting up virtual environment...")
 
         try:
-            # Get the latest available Python version matching the user's input
-            try:
-                python_version = get_latest_available_python_version(python_version_input)
-            except ValueError as ve:
-                root.after(0, lambda: messagebox.showerror("Error", str(ve)))
-                return  # Exit the function if no matching version is found
-
-            set_status(f"Using Python {python_version}")
-
-            # Check if the requested Python version is installed
-            if not is_python_version_installed(python_version):
-                # Install the Python version
-                set_status(
-                    f"Installing Python {python_version} via pyenv... (this may take a while)"
-                )
-                system = platform.system()
-                env = os.environ.copy()
-                if system == "Windows":
-                    command = f"pyenv install {python_version}"
-                    shell = True
-                else:
-                    command = ["pyenv", "install", python_version]
-                    shell = False
-
-                result = subprocess.run(
-                    command,
-                    capture_output=True,
-                    text=True,
-                    env=env,
-                    shell=shell,
-                    check=False,
-                )
-                if result.returncode != 0:
-                    error_message = (
-                        f"Failed to install Python {python_version} via pyenv.\n"
-                        f"Command output:\nSTDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}"
-                    )
-                    raise RuntimeError(error_message)
-
-                set_status(f"Successfully installed Python {python_version} via pyenv.")
-
-            # Get the pyenv-managed Python executable
-            python_executable = get_pyenv_python_path(python_version)
-            if not python_executable:
-                raise FileNotFoundError(f"Could not find Python {python_version}")
-
-            messagebox.showinfo(None, f"Creating virtual environment for {script_name}.")
-            # Create the virtual environment
-            if not os.path.exists(env_path):
-                subprocess.run([python_executable, "-m", "venv", env_path], check=True)
-
-            # Determine the path to pip in the virtual environment
-            if platform.system() == "Windows":
-                pip_executable = os.path.join(env_path, "Scripts", "pip.exe")
-            else:
-                pip_executable = os.path.join(env_path, "bin", "pip")
-
-            subprocess.run(
-                [pip_executable, "install", "-r", requirements_file],
-                check=True,
-            )
-            messagebox.showinfo(
-                "Success", f"Virtual environment for {script_name} created successfully!"
+            _, python_executable = resolve_python(python_version_input)
+            create_venv(script_name, python_executable)
+            post_to_ui(
+                messagebox.showinfo,
+                "Success",
+                f"Virtual environment for {script_name} created successfully!",
             )
 
         except Exception as e:
-            handle_error(e)
+            report_setup_error(e)
         finally:
-            # Re-enable the Run button and reset the status
-            if run_button:
-                root.after(0, run_button.config, {"state": "normal"})
-            reset_status()
+            # Re-enable the Run button if the environment now exists and reset the status
+            post_to_ui(update_script_list)
+            post_to_ui(sync_run_button, script_name)
+            post_to_ui(reset_status)
 
-    # Run the setup in a separate thread to avoid freezing the GUI
-    threading.Thread(target=run_setup).start()
+    # Run the setup on a background worker to avoid freezing the GUI
+    run_in_background(run_setup)
+
+
+def setup_venvs_batch(items):
+    """
+    Set up virtual environments for several scripts in one background job.
+    items is a list of (script_name, python_version_input) pairs. Each distinct
+    version spec is resolved (and installed) once, then the environments are
+    created and populated in parallel.
+    """
+    buttons = [run_buttons[name] for name, _ in items if name in run_buttons]
+
+    def run_batch():
+        for button in buttons:
+            post_to_ui(button.config, {"state": "disabled"})
+        post_to_ui(set_status, f"Setting up {len(items)} virtual environments...")
+
+        failures = []
+        try:
+            # pyenv installs are kept sequential; they are heavy and share the pyenv tree
+            python_executables = {}
+            for version_input in dict.fromkeys(version_input for _, version_input in items):
+                try:
+                    python_executables[version_input] = resolve_python(version_input)[1]
+                except Exception as exc:
+                    failures.append(f"Python {version_input}: {exc}")
+
+            with ThreadPoolExecutor(max_workers=VENV_SETUP_WORKERS) as executor:
+                futures = {
+                    executor.submit(create_venv, name, python_executables[version_input]): name
+                    for name, version_input in items
+                    if version_input in python_executables
+                }
+                for done, future in enumerate(as_completed(futures), start=1):
+                    try:
+                        future.result()
+                    except Exception as exc:
+                        failures.append(f"{futures[future]}: {exc}")
+                    post_to_ui(set_status, f"Set up {done} of {len(futures)} environments...")
+
+            if failures:
+                report_setup_error(
+                    "Some virtual environments could not be set up:\n\n" + "\n\n".join(failures)
+                )
+            else:
+                post_to_ui(
+                    messagebox.showinfo,
+                    "Success",
+                    f"Created {len(items)} virtual environments successfully!",
+                )
+        finally:
+            post_to_ui(update_script_list)
+            for name, _ in items:
+                post_to_ui(sync_run_button, name)
+            post_to_ui(reset_status)
+
+    run_in_background(run_batch)
+
+
+def setup_missing_venvs():
+    """Set up a virtual environment for every script that does not have a working one."""
+    missing = [script for script in sorted(script_metadata) if not has_venv(script)]
+    if not missing:
+        messagebox.showinfo(
+            "Set Up Missing Envs", "Every script already has a working environment."
+        )
+        return
+
+    from tkinter import simpledialog
+
+    python_version = simpledialog.askstring(
+        "Python Version",
+        f"{len(missing)} script(s) have no working environment.\n"
+        "Enter the Python version to use (e.g., 3, 3.11, 3.11.2):",
+    )
+    if not python_version:
+        return
+    setup_venvs_batch([(script, python_version) for script in missing])
 
 
 def is_python_version_installed(python_version):
     """Check if the specified Python version is installed via pyenv."""
     try:
-        system = platform.system()
-        env = os.environ.copy()
-        if system == "Windows":
+        if IS_WINDOWS:
             command = "pyenv versions --bare"
             shell = True
         else:
@@ -418,7 +797,6 @@ def is_python_version_installed(python_version):
             command,
             capture_output=True,
             text=True,
-            env=env,
             shell=shell,
             check=False,
         )
@@ -437,58 +815,42 @@ def is_python_version_installed(python_version):
 
 
 def is_pyenv_available():
-    """Check if pyenv is installed and accessible."""
-    try:
-        system = platform.system()
-        if system == "Windows":
-            # Specify full path to pyenv.bat
-            home_dir = os.path.expanduser("~")
-            pyenv_root = os.path.join(home_dir, ".pyenv", "pyenv-win")
-            pyenv_executable = os.path.join(pyenv_root, "bin", "pyenv.bat")
-            command = [pyenv_executable, "--version"]
-            shell = False
-        else:
-            command = ["pyenv", "--version"]
-            shell = False
-
-        result = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            env=os.environ.copy(),
-            shell=shell,
-            check=False,
-        )
-        return result.returncode == 0
-    except FileNotFoundError:
-        return False
+    """Check if pyenv is installed and accessible, without paying for a pyenv call."""
+    if IS_WINDOWS:
+        return os.path.isfile(PYENV_EXECUTABLE)
+    return shutil.which("pyenv") is not None
+
+
+# pyenv installation guidance as (window title, instructions, link), by platform
+PYENV_INSTALL_GUIDES = {
+    "win32": (
+        "Install pyenv-win",
+        "pyenv-win is not installed. Please install it by following the instructions at:\n\n",
+        "https://github.com/pyenv-win/pyenv-win#installation",
+    ),
+}
+DEFAULT_PYENV_INSTALL_GUIDE = (
+    "Install pyenv",
+    "pyenv is not installed. Please install it by following the instructions at:\n\n",
+    "https://github.com/pyenv/pyenv#installation",
+)
 
 
 def install_pyenv():
     """Guide the user to install pyenv based on their operating system."""
-    system = platform.system()
-
     # Common instructions and links for pyenv installation
-    if system == "Windows":
-        title = "Install pyenv-win"
-        instructions = (
-            "pyenv-win is not installed. Please install it by following the instructions at:\n\n"
-        )
-        link_text = "https://github.com/pyenv-win/pyenv-win#installation"
-        after_instructions = "\n\nAfter installation, restart this application."
-    else:
-        title = "Install pyenv"
-        instructions = (
-            "pyenv is not installed. Please install it by following the instructions at:\n\n"
-        )
-        link_text = "https://github.com/pyenv/pyenv#installation"
-        after_instructions = "\n\nAfter installation, restart this application."
+    title, instructions, link_text = PYENV_INSTALL_GUIDES.get(
+        sys.platform, DEFAULT_PYENV_INSTALL_GUIDE
+    )
+    after_instructions = "\n\nAfter installation, restart this application."
 
     # Function to create the installation window
     def open_install_pyenv():
+        import webbrowser  # Only needed here, so kept out of startup
+
         install_window = tk.Toplevel(root)
         install_window.title(title)
-        install_window.geometry("500x300")
+        install_window.geometry(INSTALL_PYENV_GEOMETRY)
         install_window.resizable(False, False)
 
         # Text widget to display instructions
@@ -526,21 +888,27 @@ def install_pyenv():
 
         # Copy Link Button
         def copy_link():
-            root.clipboard_clear()
-            root.clipboard_append(link_text)
+            set_clipboard(link_text)
             messagebox.showinfo("Copied", "Link copied to clipboard!")
 
-        copy_button = tk.Button(buttons_frame, text="Copy Link", command=copy_link)
+        copy_button = tk.Button(
+            buttons_frame, text="Copy Link", command=copy_link, font=DEFAULT_FONT
+        )
         copy_button.pack(side="left", padx=5)
 
         # Open Link Button
         open_link_button = tk.Button(
-            buttons_frame, text="Open Link", command=lambda: webbrowser.open_new(link_text)
+            buttons_frame,
+            text="Open Link",
+            command=lambda: webbrowser.open_new(link_text),
+            font=DEFAULT_FONT,
         )
         open_link_button.pack(side="left", padx=5)
 
         # Close Button
-        close_button = tk.Button(buttons_frame, text="Close", command=install_window.destroy)
+        close_button = tk.Button(
+            buttons_frame, text="Close", command=install_window.destroy, font=DEFAULT_FONT
+        )
         close_button.pack(side="right", padx=5)
 
     # Schedule the function to run in the main thread
@@ -551,6 +919,8 @@ def install_pyenv():
 
 def rebuild_venv(script_name, run_button):
     """Rebuild the virtual environment for a script."""
+    from tkinter import simpledialog
+
     env_path = os.path.join(ENVS_DIR, script_name)
 
     # Prompt user for Python version
@@ -561,145 +931,205 @@ def rebuild_venv(script_name, run_button):
         messagebox.showerror("Error", "Python version is required!")
         return
 
+    def prefetch_python_version():
+        # Any error resurfaces (and is reported) when resolve_python repeats the lookup
+        try:
+            get_latest_available_python_version(python_version)
+        except Exception:
+            pass
+
     def run_rebuild():
+        # Disable the Run button and update the status
+        if run_button:
+            post_to_ui(run_button.config, {"state": "disabled"})
+        post_to_ui(set_status, "Rebuilding virtual environment...")
+
         try:
-            # Remove existing virtual environment
+            # Look up the requested version while the existing environment is removed;
+            # resolve_python then reads it from the cache. The setup runs inline rather
+            # than being queued again, so a rebuild never stops between the two steps.
+            lookup = threading.Thread(target=prefetch_python_version, daemon=True)
+            lookup.start()
             if os.path.exists(env_path):
                 shutil.rmtree(env_path)
+            lookup.join()
 
             # Create a new virtual environment
-            setup_venv(script_name, python_version, run_button)
-        except Exception as exc:
-            root.after(
-                0,
-                lambda: messagebox.showerror(
-                    "Error", f"Failed to rebuild virtual environment for {script_name}:\n{exc}"
-                ),
+            _, python_executable = resolve_python(python_version)
+            create_venv(script_name, python_executable)
+            post_to_ui(
+                messagebox.showinfo,
+                "Success",
+                f"Virtual environment for {script_name} rebuilt successfully!",
             )
+        except Exception as exc:
+            report_setup_error(f"Failed to rebuild virtual environment for {script_name}:\n{exc}")
+        finally:
+            # Re-enable the Run button if the environment now exists and reset the status
+            post_to_ui(update_script_list)
+            post_to_ui(sync_run_button, script_name)
+            post_to_ui(reset_status)
 
-    # Start the rebuild in a separate thread
-    threading.Thread(target=run_rebuild).start()
+    # Start the rebuild on a background worker
+    run_in_background(run_rebuild)
 
 
 def update_script_list():
-    run_buttons.clear()
-
-    for widget in list_frame.winfo_children():
-        widget.destroy()
-
-    # Add the header
-    header_font = tkfont.Font(weight="bold")
-    header_label = tk.Label(list_frame, text="Scripts", font=header_font)
-    header_label.pack(fill="x", pady=(0, 5))
+    """Sync script metadata with the scripts directory and refresh the changed rows."""
+    global _last_snapshot, _render_generation
 
     # Update metadata for added and deleted scripts
-    scripts = os.listdir(SCRIPTS_DIR)
-    for script in scripts:
-        if script not in script_metadata:
-            script_metadata[script] = 0
-    for script in list(script_metadata.keys()):
-        if script not in scripts:
-            del script_metadata[script]
-    save_metadata()
-
-    # Sort scripts by last runtime (descending)
-    sorted_scripts = sorted(scripts, key=lambda s: script_metadata.get(s, 0), reverse=True)
-
-    # Create the UI for each script
-    for script in sorted_scripts:
-        script_frame = tk.Frame(list_frame, relief="solid", borderwidth=1, padx=5, pady=5)
-        script_frame.pack(fill="x", pady=5)
-
-        # Frame for script name and buttons
-        script_name_frame = tk.Frame(script_frame)
-        script_name_frame.pack(fill="x")
+    # Sorted by name so that scripts with the same last run time keep a stable order
+    with os.scandir(SCRIPTS_DIR) as entries:
+        scripts = sorted(entry.name for entry in entries if entry.is_dir())
+    scripts_set = set(scripts)
+    known_scripts = set(script_metadata)
+    for script in scripts_set - known_scripts:
+        script_metadata[script] = 0
+    for script in known_scripts - scripts_set:
+        del script_metadata[script]
+    if scripts_set != known_scripts:
+        save_metadata()
+
+    # Nothing to redraw if no script was added, removed, run or given an environment
+    # since last time. Whether the venv Python exists is probed here, once per refresh,
+    # so rows can disable Run instead of failing when it is clicked.
+    new_snapshot = {script: (script_metadata[script], has_venv(script)) for script in scripts}
+    if new_snapshot == _last_snapshot:
+        return
 
-        # Script name + last run label
-        last_run = (
-            time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(script_metadata[script]))
-            if script_metadata[script]
-            else "Never"
-        )
+    # Drop the rows of removed scripts and update the others in place
+    for script in list(script_frames):
+        if script not in new_snapshot:
+            script_frames.pop(script).destroy()
+            run_buttons.pop(script, None)
+            last_run_labels.pop(script, None)
+            continue
+        last_run, venv_ready = new_snapshot[script]
+        old_last_run, old_venv_ready = _last_snapshot.get(script, (None, None))
+        if last_run != old_last_run:
+            last_run_labels[script].config(text=format_last_run(last_run))
+        if venv_ready != old_venv_ready:
+            run_buttons[script].config(state="normal" if venv_ready else "disabled")
+    _last_snapshot = new_snapshot
+
+    # Sort scripts by last runtime (descending), comparing prebuilt (time, name) pairs
+    pairs = [(new_snapshot[script][0], script) for script in scripts]
+    pairs.sort(key=itemgetter(0), reverse=True)
+    sorted_scripts = [script for _, script in pairs]
+
+    # Lay the rows out below the header, superseding any render still in progress
+    _render_generation += 1
+    render_script_rows(sorted_scripts, 0, header_label, _render_generation)
+
+
+def render_script_rows(sorted_scripts, start, previous_widget, generation):
+    """
+    Create (if needed) and pack one batch of script rows in order, then schedule
+    the next batch for when Tk is idle so input and repaints are handled in between.
+    """
+    if generation != _render_generation:
+        return  # A newer refresh took over
+
+    end = start + RENDER_BATCH_SIZE
+    for script in sorted_scripts[start:end]:
+        if script not in script_frames:
+            script_frames[script] = create_script_row(script)
+        script_frames[script].pack(fill="x", pady=5, after=previous_widget)
+        previous_widget = script_frames[script]
+
+    if end < len(sorted_scripts):
+        root.after_idle(render_script_rows, sorted_scripts, end, previous_widget, generation)
+
+
+@lru_cache(maxsize=1024)
+def format_last_run(last_run_time):
+    """Return the last run label text for a script's last run timestamp (0 if never run)."""
+    # Memoized, as timestamps rarely change between refreshes and strftime is not free
+    last_run = (
+        time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(last_run_time))
+        if last_run_time
+        else "Never"
+    )
+    return f" (Last ran at: {last_run})"
 
-        script_info_frame = tk.Frame(script_name_frame)
-        script_info_frame.pack(side="left", fill="x", expand=True)
 
-        script_name_label = tk.Label(script_info_frame, text=script, anchor="w")
-        script_name_label.pack(side="left")
+def create_script_row(script):
+    """Create the UI row for a script and return its frame (packed by the caller)."""
+    script_frame = tk.Frame(list_frame, relief="solid", borderwidth=1, padx=5, pady=5)
 
-        last_run_label = tk.Label(
-            script_info_frame, text=f" (Last ran at: {last_run})", fg="grey", anchor="w"
-        )
-        last_run_label.pack(side="left")
+    # Frame for script name and buttons
+    script_name_frame = tk.Frame(script_frame)
+    script_name_frame.pack(fill="x")
 
-        # Context menu
-        context_menu = tk.Menu(root, tearoff=0)
-        context_menu.add_command(
-            label="Rebuild Env",
-            command=lambda s=script: rebuild_venv(s, run_buttons[s]),
-        )
-        context_menu.add_command(
-            label="Archive Script",
-            command=lambda s=script: archive_script(s),
-        )
-        context_menu.add_command(
-            label="Modify Requirements",
-            command=lambda s=script: modify_requirements(s),
-        )
-        context_menu.add_command(
-            label="Modify Script",
-            command=lambda s=script: modify_script(s),
-        )
-        context_menu.add_command(
-            label="Edit .env Variables",
-            command=lambda s=script: edit_env_variables(s),
-        )
+    # Script name + last run label
+    script_info_frame = tk.Frame(script_name_frame)
+    script_info_frame.pack(side="left", fill="x", expand=True)
 
-        context_menu.add_command(
-            label="Run as Administrator",
-            command=lambda s=script: run_script_admin(s),
-        )
+    script_name_label = tk.Label(script_info_frame, text=script, anchor="w", font=DEFAULT_FONT)
+    script_name_label.pack(side="left")
 
-        # Hamburger menu button
-        btn_hamburger = tk.Button(script_name_frame, text="⋯", relief="flat", padx=5)
-        btn_hamburger.config(
-            command=lambda menu=context_menu, btn=btn_hamburger: show_context_menu(menu, btn)
-        )
-        btn_hamburger.pack(side="right", padx=5, pady=5)
+    last_run_label = tk.Label(
+        script_info_frame,
+        text=format_last_run(script_metadata[script]),
+        fg="grey",
+        anchor="w",
+        font=DEFAULT_FONT,
+    )
+    last_run_label.pack(side="left")
+
+    # Hamburger menu button, opening the shared context menu for this script
+    btn_hamburger = tk.Button(script_name_frame, text="⋯", relief="flat", padx=5, font=DEFAULT_FONT)
+    btn_hamburger.config(command=lambda s=script, btn=btn_hamburger: show_context_menu(s, btn))
+    btn_hamburger.pack(side="right", padx=5, pady=5)
+
+    # Run Button
+    btn_run = tk.Button(
+        script_name_frame,
+        text="Run",
+        command=lambda s=script: run_script(s),
+        font=DEFAULT_FONT,
+        state="normal" if _last_snapshot[script][1] else "disabled",
+    )
+    btn_run.pack(side="right", padx=5)
 
-        # Run Button
-        btn_run = tk.Button(
-            script_name_frame,
-            text="Run",
-            command=lambda s=script: run_script(s),
-        )
-        btn_run.pack(side="right", padx=5)
+    # Store the widget references
+    run_buttons[script] = btn_run
+    last_run_labels[script] = last_run_label
 
-        # Store the button reference
-        run_buttons[script] = btn_run
+    return script_frame
 
 
-def show_context_menu(menu, button):
-    """Display the context menu below the button."""
+def show_context_menu(script, button):
+    """Display the shared context menu for a script below the button."""
+    global _active_script
+    _active_script = script
     x = button.winfo_rootx()
     y = button.winfo_rooty() + button.winfo_height()
-    menu.tk_popup(x, y)
+    CONTEXT_MENU.tk_popup(x, y)
 
 
 def modify_requirements(script_name):
     """Open the requirements.txt file for editing and rebuild the environment upon saving."""
     script_path = os.path.join(SCRIPTS_DIR, script_name, "requirements.txt")
 
-    # Check if the requirements.txt file exists
-    if not os.path.exists(script_path):
-        with open(script_path, "w", encoding="utf-8") as req_file:
-            req_file.write("")  # Create an empty requirements.txt file if it doesn't exist
+    # Read the current requirements, starting empty if the file doesn't exist yet
+    try:
+        with open(script_path, "r", encoding="utf-8") as req_file:
+            existing_content = req_file.read()
+        file_exists = True
+    except FileNotFoundError:
+        existing_content = ""
+        file_exists = False
 
     # Open a new window to edit requirements
     def save_changes():
         new_content = req_text.get("1.0", tk.END).strip()
-        with open(script_path, "w", encoding="utf-8") as req_file:
-            req_file.write(new_content)
+        # Only write the file if it is missing or changed; the rebuild below also retries
+        # failed installs
+        if not file_exists or new_content != existing_content.strip():
+            with open(script_path, "w", encoding="utf-8") as req_file:
+                req_file.write(new_content)
 
         # Rebuild the environment
         edit_window.destroy()
@@ -708,16 +1138,16 @@ def modify_requirements(script_name):
     # Create and configure the editing window
     edit_window = tk.Toplevel(root)
     edit_window.title(f"Modify Requirements - {script_name}")
-    edit_window.geometry("600x400")  # Adjust size if needed
+    edit_window.geometry(EDITOR_GEOMETRY)
 
     # Use a grid layout for better control
     edit_window.rowconfigure(1, weight=1)  # Allow text widget to expand
     edit_window.columnconfigure(0, weight=1)  # Allow full width expansion
 
     # Add label
-    tk.Label(edit_window, text=f"Editing requirements.txt for {script_name}:").grid(
-        row=0, column=0, sticky="w", padx=5, pady=(5, 0)
-    )
+    tk.Label(
+        edit_window, text=f"Editing requirements.txt for {script_name}:", font=DEFAULT_FONT
+    ).grid(row=0, column=0, sticky="w", padx=5, pady=(5, 0))
 
     # Frame to hold the text box and scrollbar
     text_frame = tk.Frame(edit_window)
@@ -733,25 +1163,24 @@ def modify_requirements(script_name):
     scrollbar.pack(side="right", fill="y")
 
     # Load existing content into the text box
-    with open(script_path, "r", encoding="utf-8") as req_file:
-        req_text.insert("1.0", req_file.read())
+    req_text.insert("1.0", existing_content)
 
     # Save button
-    tk.Button(edit_window, text="Save and Rebuild Environment", command=save_changes).grid(
-        row=2, column=0, pady=10
-    )
+    tk.Button(
+        edit_window, text="Save and Rebuild Environment", command=save_changes, font=DEFAULT_FONT
+    ).grid(row=2, column=0, pady=10)
 
 
 def modify_script(script_name):
     """Open the main.py script for editing."""
     script_path = os.path.join(SCRIPTS_DIR, script_name, "main.py")
 
-    # Check if the script exists
-    if not os.path.exists(script_path):
-        with open(script_path, "w", encoding="utf-8") as script_file:
-            script_file.write(
-                "# Your script starts here\n"
-            )  # Create a default script if it doesn't exist
+    # Read the current script, starting from a placeholder if it doesn't exist yet
+    try:
+        with open(script_path, "r", encoding="utf-8") as script_file:
+            existing_content = script_file.read()
+    except FileNotFoundError:
+        existing_content = "# Your script starts here\n"
 
     # Open a new window to edit the script
     def save_changes():
@@ -764,14 +1193,14 @@ def modify_script(script_name):
     # Create and configure the editing window
     edit_window = tk.Toplevel(root)
     edit_window.title(f"Modify Script - {script_name}")
-    edit_window.geometry("600x400")
+    edit_window.geometry(EDITOR_GEOMETRY)
 
     # Use a grid layout for better control
     edit_window.rowconfigure(1, weight=1)  # Allow text widget to expand
     edit_window.columnconfigure(0, weight=1)  # Allow full width expansion
 
     # Add label
-    tk.Label(edit_window, text=f"Editing main.py for {script_name}:").grid(
+    tk.Label(edit_window, text=f"Editing main.py for {script_name}:", font=DEFAULT_FONT).grid(
         row=0, column=0, sticky="w", padx=5, pady=(5, 0)
     )
 
@@ -789,25 +1218,22 @@ def modify_script(script_name):
     scrollbar.pack(side="right", fill="y")
 
     # Load existing content into the text box
-    with open(script_path, "r", encoding="utf-8") as script_file:
-        script_text.insert("1.0", script_file.read())
+    script_text.insert("1.0", existing_content)
 
     # Save button
-    tk.Button(edit_window, text="Save Script", command=save_changes).grid(row=2, column=0, pady=10)
+    tk.Button(edit_window, text="Save Script", command=save_changes, font=DEFAULT_FONT).grid(
+        row=2, column=0, pady=10
+    )
 
 
 def archive_script(script_name):
     """Move the script and its environment to archived directories."""
     try:
-        # Create archived directories if they don't exist
-        os.makedirs(os.path.join(BASE_DIR, "archived_scripts"), exist_ok=True)
-        os.makedirs(os.path.join(BASE_DIR, "archived_environments"), exist_ok=True)
-
         script_src = os.path.join(SCRIPTS_DIR, script_name)
         env_src = os.path.join(ENVS_DIR, script_name)
 
-        script_dest = os.path.join(BASE_DIR, "archived_scripts", script_name)
-        env_dest = os.path.join(BASE_DIR, "archived_environments", script_name)
+        script_dest = os.path.join(ARCHIVED_SCRIPTS_DIR, script_name)
+        env_dest = os.path.join(ARCHIVED_ENVS_DIR, script_name)
 
         # Archive the script directory if it exists
         if os.path.exists(script_src):
@@ -829,49 +1255,105 @@ def archive_script(script_name):
         messagebox.showerror("Error", f"Failed to archive script '{script_name}': {e}")
 
 
+def script_run_paths(script_name):
+    """Return the venv Python executable and main.py paths for a script, joined once."""
+    paths = _run_paths_cache.get(script_name)
+    if paths is None:
+        env_path = os.path.join(ENVS_DIR, script_name)
+        # Determine the path to the Python executable in the virtual environment
+        if IS_WINDOWS:
+            python_executable = os.path.join(env_path, "Scripts", "python.exe")
+        else:
+            python_executable = os.path.join(env_path, "bin", "python")
+        script_path = os.path.join(SCRIPTS_DIR, script_name, "main.py")
+        paths = _run_paths_cache[script_name] = (python_executable, script_path)
+    return paths
+
+
+def has_venv(script_name):
+    """Return whether the script's virtual environment has a Python executable."""
+    return os.path.isfile(script_run_paths(script_name)[0])
+
+
+def sync_run_button(script_name):
+    """Enable the script's Run button only if its virtual environment exists."""
+    button = run_buttons.get(script_name)
+    if button is not None:
+        button.config(state="normal" if has_venv(script_name) else "disabled")
+
+
 def run_script(script_name):
     # Record the current timestamp as the last runtime
     script_metadata[script_name] = time.time()
     save_metadata()
 
-    env_path = os.path.join(ENVS_DIR, script_name)
-    script_path = os.path.join(SCRIPTS_DIR, script_name, "main.py")
+    python_executable, script_path = script_run_paths(script_name)
     if not os.path.exists(script_path):
         messagebox.showerror("Error", "Script not found!")
         return
 
-    # Determine the path to the Python executable in the virtual environment
-    system = platform.system()
-    if system == "Windows":
-        python_executable = os.path.join(env_path, "Scripts", "python.exe")
-    else:
-        python_executable = os.path.join(env_path, "bin", "python")
-
     # Open the script in a new terminal
-    if system == "Windows":
-        command = f'start cmd /k "echo Running script {script_name} && echo. && echo. && "{python_executable}" "{script_path}""'
-        subprocess.Popen(command, shell=True)
-    elif system == "Darwin":  # macOS
-        temp_script_path = os.path.join(BASE_DIR, "run_script.sh")
-        with open(temp_script_path, "w", encoding="utf-8") as temp_script:
-            temp_script.write('rm -- "$0"\n')
-            temp_script.write("#!/bin/bash\n")
-            temp_script.write(f"echo 'Running script {script_name}'\n")
-            temp_script.write("echo\n")
-            temp_script.write("echo\n")
-            temp_script.write(f"'{python_executable}' '{script_path}'\n")
-        os.chmod(temp_script_path, 0o755)
-        subprocess.Popen(["open", "-a", "Terminal.app", temp_script_path])
-    elif system == "Linux":
-        subprocess.Popen(
-            [
-                "x-terminal-emulator",
-                "-e",
-                f"echo 'Running script {script_name}' && echo && echo && '{python_executable}' '{script_path}'",
-            ]
+    run_in_terminal(f"Running script {script_name}", python_executable, script_path)
+
+
+def run_in_windows_terminal(banner, python_executable, script_path):
+    """Run a script in a new cmd window that stays open afterwards."""
+    run_command = subprocess.list2cmdline([python_executable, script_path])
+    # Launch cmd straight into its own console rather than through a shell running
+    # `start`. The command line is passed as a string so cmd sees its own quoting.
+    command = f'cmd /k "echo {banner} && echo. && echo. && {run_command}"'
+    subprocess.Popen(command, creationflags=subprocess.CREATE_NEW_CONSOLE)
+
+
+def run_in_mac_terminal(banner, python_executable, script_path):
+    """Run a script in a new Terminal.app window through its environment's launcher."""
+    env_path = os.path.dirname(os.path.dirname(python_executable))
+    launcher_path = os.path.join(env_path, MAC_LAUNCHER_NAME)
+    if not os.path.isfile(launcher_path):
+        if not os.path.isdir(env_path):
+            messagebox.showerror("Error", "Virtual environment not found! Set it up first.")
+            return
+        launcher_content = MAC_LAUNCHER_TEMPLATE.format(
+            banner=shlex.quote(banner),
+            python=shlex.quote(python_executable),
+            script=shlex.quote(script_path),
         )
-    else:
-        messagebox.showerror("Error", "Unsupported operating system!")
+        # Create the file already executable, in one call; if another run created it
+        # in the meantime, use that one
+        try:
+            launcher_fd = os.open(launcher_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o755)
+        except FileExistsError:
+            pass
+        else:
+            with os.fdopen(launcher_fd, "w", encoding="utf-8") as launcher:
+                launcher.write(launcher_content)
+    subprocess.Popen(["open", "-a", "Terminal.app", launcher_path])
+
+
+def run_in_linux_terminal(banner, python_executable, script_path):
+    """Run a script in the default terminal emulator."""
+    subprocess.Popen(
+        [
+            "x-terminal-emulator",
+            "-e",
+            f"echo {shlex.quote(banner)} && echo && echo && "
+            f"{shlex.quote(python_executable)} {shlex.quote(script_path)}",
+        ]
+    )
+
+
+def run_in_unsupported_terminal(banner, python_executable, script_path):
+    """Report that scripts cannot be run on this operating system."""
+    messagebox.showerror("Error", "Unsupported operating system!")
+
+
+# The platform is fixed for the process, so the terminal launcher is picked once
+TERMINAL_LAUNCHERS = {
+    "win32": run_in_windows_terminal,
+    "darwin": run_in_mac_terminal,
+    "linux": run_in_linux_terminal,
+}
+run_in_terminal = TERMINAL_LAUNCHERS.get(sys.platform, run_in_unsupported_terminal)
 
 
 def run_script_admin(script_name):
@@ -885,16 +1367,12 @@ def run_script_admin(script_name):
     save_metadata()
 
     # Paths
-    env_path = os.path.join(ENVS_DIR, script_name)
-    script_path = os.path.join(SCRIPTS_DIR, script_name, "main.py")
+    python_executable, script_path = script_run_paths(script_name)
     if not os.path.exists(script_path):
         messagebox.showerror("Error", f"Script '{script_name}' not found!")
         return
 
-    system = platform.system()
-    if system == "Windows":
-        python_executable = os.path.join(env_path, "Scripts", "python.exe")
-
+    if IS_WINDOWS:
         ps_cmd = (
             f"Start-Process cmd -Verb runAs -ArgumentList "
             f'\'/k echo "Running script {script_name} as Admin" '
@@ -915,7 +1393,7 @@ def run_script_admin(script_name):
         # 3) Launch asynchronously (no blocking)
         subprocess.Popen(process_args)
 
-    elif system in ("Darwin", "Linux"):
+    elif IS_MAC or IS_LINUX:
         messagebox.showwarning(
             "Not Supported", "Running as Administrator is only supported on Windows in this script."
         )
@@ -925,6 +1403,9 @@ def run_script_admin(script_name):
 
 # GUI Functions
 def add_script():
+    # Only needed once a prompt is shown, so kept out of startup
+    from tkinter import simpledialog
+
     script_name = simpledialog.askstring("New Script", "Enter a name for the new script:")
     if not script_name:
         return
@@ -972,16 +1453,10 @@ def add_script():
             req_file.write(requirements_content)
 
         # Write .env file
-        with open(os.path.join(script_dir, ".env"), "w", encoding="utf-8") as env_file:
-            # Add disclaimers and example
-            env_file.write(
-                "# This is where you should define environment variables, if necessary.\n"
-                "# For example, it might look like:\n"
-                '# OPENAI_KEY="secret-openai-key-here"\n'
-                '# API_TOKEN="your-api-token"\n\n'
-            )
-            # Add user-entered environment variables
-            env_file.write(env_content)
+        with open(dotenv_path(script_name), "wb") as env_file:
+            # Add disclaimers and example, then the user-entered environment variables
+            env_file.write(DEFAULT_ENV_BYTES)
+            env_file.write(env_content.encode("utf-8"))
 
         setup_venv(script_name, python_version)
         update_script_list()
@@ -990,101 +1465,261 @@ def add_script():
     # Create content input window
     content_window = tk.Toplevel(root)
     content_window.title("Script, Requirements, and Environment Variables Input")
-    content_window.geometry("600x600")
+    content_window.geometry(CONTENT_INPUT_GEOMETRY)
+
+    def add_text_box(height):
+        text_frame, text_box = create_text_box(content_window, height=height)
+        text_frame.pack(fill="both", expand=True, padx=5, pady=5)
+        return text_box
 
     # Script Input
-    tk.Label(content_window, text="Script Content (main.py):").pack(anchor="w", padx=5, pady=5)
-    script_text = scrolledtext.ScrolledText(content_window, wrap=tk.WORD, height=10)
-    script_text.pack(fill="both", expand=True, padx=5, pady=5)
+    tk.Label(content_window, text="Script Content (main.py):", font=DEFAULT_FONT).pack(
+        anchor="w", padx=5, pady=5
+    )
+    script_text = add_text_box(10)
 
     # Requirements Input
-    tk.Label(content_window, text="Requirements (requirements.txt):").pack(
+    tk.Label(content_window, text="Requirements (requirements.txt):", font=DEFAULT_FONT).pack(
         anchor="w", padx=5, pady=5
     )
-    req_text = scrolledtext.ScrolledText(content_window, wrap=tk.WORD, height=5)
-    req_text.pack(fill="both", expand=True, padx=5, pady=5)
+    req_text = add_text_box(5)
 
     # Environment Variables Input
-    tk.Label(content_window, text="Environment Variables (.env):").pack(anchor="w", padx=5, pady=5)
-    env_text = scrolledtext.ScrolledText(content_window, wrap=tk.WORD, height=5)
-    env_text.pack(fill="both", expand=True, padx=5, pady=5)
+    tk.Label(content_window, text="Environment Variables (.env):", font=DEFAULT_FONT).pack(
+        anchor="w", padx=5, pady=5
+    )
+    env_text = add_text_box(5)
 
     # Populate with default content
     env_text.insert(
         tk.END, """# Add your environment variables here\n# Example: API_KEY="your_secret_key"\n"""
     )
 
+    create_wrap_toggle(content_window, (script_text, req_text, env_text)).pack(anchor="w", padx=5)
+
     # Save Button
-    tk.Button(content_window, text="Save and Create Environment", command=save_inputs).pack(pady=10)
+    tk.Button(
+        content_window, text="Save and Create Environment", command=save_inputs, font=DEFAULT_FONT
+    ).pack(pady=10)
+
+
+def create_text_box(parent, **options):
+    """Return a frame holding a non-wrapping Text with both scrollbars, and the Text itself."""
+    # Wrapping is off by default: Tk has to recompute line breaks on every insert and
+    # resize when it is on, which gets slow for long content
+    text_frame = tk.Frame(parent)
+    text_frame.rowconfigure(0, weight=1)
+    text_frame.columnconfigure(0, weight=1)
+    text_box = tk.Text(text_frame, wrap=tk.NONE, **options)
+    y_scrollbar = ttk.Scrollbar(text_frame, orient="vertical", command=text_box.yview)
+    x_scrollbar = ttk.Scrollbar(text_frame, orient="horizontal", command=text_box.xview)
+    text_box.configure(yscrollcommand=y_scrollbar.set, xscrollcommand=x_scrollbar.set)
+    text_box.grid(row=0, column=0, sticky="nsew")
+    y_scrollbar.grid(row=0, column=1, sticky="ns")
+    x_scrollbar.grid(row=1, column=0, sticky="ew")
+    return text_frame, text_box
+
+
+def create_wrap_toggle(parent, text_boxes):
+    """Return a checkbutton that turns word wrapping on or off for the given Text widgets."""
+    wrap_var = tk.BooleanVar(master=parent, value=False)
+
+    def toggle_wrap():
+        wrap = tk.WORD if wrap_var.get() else tk.NONE
+        for text_box in text_boxes:
+            text_box.configure(wrap=wrap)
+
+    return tk.Checkbutton(
+        parent, text="Wrap lines", variable=wrap_var, command=toggle_wrap, font=DEFAULT_FONT
+    )
+
+
+def read_file_bytes(path):
+    """Read a whole file into a single bytearray sized from its stat."""
+    with open(path, "rb", buffering=0) as raw_file:
+        buffer = bytearray(os.fstat(raw_file.fileno()).st_size)
+        filled = 0
+        with memoryview(buffer) as view:
+            while filled < len(buffer):
+                read = raw_file.readinto(view[filled:])
+                if not read:
+                    break  # The file shrank while being read
+                filled += read
+    del buffer[filled:]
+    return buffer
+
+
+def dotenv_path(script_name):
+    """Return the path of a script's .env file, joining it only once per script."""
+    path = _dotenv_path_cache.get(script_name)
+    if path is None:
+        path = _dotenv_path_cache[script_name] = os.path.join(SCRIPTS_DIR, script_name, ".env")
+    return path
 
 
 def edit_env_variables(script_name):
     """Open the .env file for editing."""
-    env_path = os.path.join(SCRIPTS_DIR, script_name, ".env")
+    env_path = dotenv_path(script_name)
 
     # Check if the .env file exists, create it if not
     if not os.path.exists(env_path):
-        with open(env_path, "w", encoding="utf-8") as env_file:
-            env_file.write(
-                "# This is where you should define environment variables, if necessary.\n"
-                "# For example, it might look like:\n"
-                '# OPENAI_KEY="secret-openai-key-here"\n'
-                '# API_TOKEN="your-api-token"\n\n'
-            )
+        with open(env_path, "wb") as env_file:
+            env_file.write(DEFAULT_ENV_BYTES)
 
     # Open a new window to edit the .env file
     def save_changes():
-        new_content = env_text.get("1.0", tk.END).strip()
-        with open(env_path, "w", encoding="utf-8") as env_file:
-            env_file.write(new_content)
+        # Tk tracks whether the buffer was edited since loading; if not, there is nothing to write
+        if not env_text.edit_modified():
+            edit_window.destroy()
+            return
+        content = env_text.get("1.0", "end-1c")
         edit_window.destroy()
-        messagebox.showinfo("Success", f"Updated .env file for {script_name}.")
+
+        # Skip the write entirely if nothing changed
+        if hashlib.sha1(content.encode("utf-8")).digest() == original_digest:
+            return
+        new_content = content.strip()
+
+        def write_env_file():
+            # Write a temporary file and swap it in, off the Tk thread. Not queued
+            # behind run_in_background jobs, which can take minutes.
+            try:
+                tmp_path = env_path + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8") as env_file:
+                    env_file.write(new_content)
+                os.replace(tmp_path, env_path)
+                post_to_ui(messagebox.showinfo, "Success", f"Updated .env file for {script_name}.")
+            except OSError as e:
+                post_to_ui(
+                    messagebox.showerror, "Error", f"Failed to save .env for {script_name}: {e}"
+                )
+
+        threading.Thread(target=write_env_file).start()
 
     # Create and configure the editing window
     edit_window = tk.Toplevel(root)
     edit_window.title(f"Edit .env - {script_name}")
-    edit_window.geometry("600x400")
+    edit_window.geometry(EDITOR_GEOMETRY)
 
     # Use a grid layout for better control
     edit_window.rowconfigure(1, weight=1)  # Allow text widget to expand
     edit_window.columnconfigure(0, weight=1)  # Allow full width expansion
 
     # Add label
-    tk.Label(edit_window, text=f"Editing .env for {script_name}:").grid(
+    tk.Label(edit_window, text=f"Editing .env for {script_name}:", font=DEFAULT_FONT).grid(
         row=0, column=0, sticky="w", padx=5, pady=(5, 0)
     )
 
-    # Frame to hold the text box and scrollbar
-    text_frame = tk.Frame(edit_window)
+    # .env text box with scrollbars, and a toggle for word wrapping
+    text_frame, env_text = create_text_box(edit_window)
     text_frame.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
+    create_wrap_toggle(edit_window, (env_text,)).grid(row=0, column=0, sticky="e", padx=5)
+
+    # Save button, enabled once the content has been loaded
+    save_button = tk.Button(
+        edit_window,
+        text="Save .env File",
+        command=save_changes,
+        state="disabled",
+        font=DEFAULT_FONT,
+    )
+    save_button.grid(row=2, column=0, pady=10)
+
+    # Read the file into one buffer and decode it once, hashing the raw bytes so that
+    # saving unchanged content can be skipped. Newlines are normalized the way a
+    # text-mode read would.
+    raw_content = read_file_bytes(env_path)
+    original_digest = hashlib.sha1(raw_content).digest()
+    content = raw_content.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    del raw_content
+
+    # Insert the content in chunks, yielding to the event loop between them so a
+    # large file does not stall the UI
+    env_text.config(state="disabled")
+
+    def load_next_chunk(start=0):
+        if not env_text.winfo_exists():
+            return  # Window closed mid-load
+        if start >= len(content):
+            env_text.config(state="normal")
+            env_text.edit_modified(False)  # Loading the file is not an edit
+            save_button.config(state="normal")
+            return
+        env_text.config(state="normal")
+        env_text.insert(tk.END, content[start : start + FILE_CHUNK_SIZE])
+        env_text.config(state="disabled")
+        root.after_idle(load_next_chunk, start + FILE_CHUNK_SIZE)
 
-    # Scrollbar
-    scrollbar = tk.Scrollbar(text_frame, orient="vertical")
-
-    # .env text box with integrated scrollbar
-    env_text = tk.Text(text_frame, wrap=tk.WORD, yscrollcommand=scrollbar.set)
-    env_text.pack(side="left", fill="both", expand=True)
-    scrollbar.config(command=env_text.yview)
-    scrollbar.pack(side="right", fill="y")
+    root.after_idle(load_next_chunk)
 
-    # Load existing content into the text box
-    with open(env_path, "r", encoding="utf-8") as env_file:
-        env_text.insert("1.0", env_file.read())
 
-    # Save button
-    tk.Button(edit_window, text="Save .env File", command=save_changes).grid(
-        row=2, column=0, pady=10
-    )
+def set_clipboard(text):
+    """Replace the clipboard contents, calling Tcl directly rather than through Tkinter."""
+    display = str(root)
+    root.tk.call("clipboard", "clear", "-displayof", display)
+    root.tk.call("clipboard", "append", "-displayof", display, "--", text)
 
 
 def set_status(message):
     """Set the status message and style."""
-    progress_label.config(text=message, fg=default_fg_color)
+    schedule_status(message, default_fg_color)
 
 
 def reset_status():
     """Reset the status to its default greyed-out placeholder."""
-    progress_label.config(text="Status", fg="grey")  # Greyed-out style
+    schedule_status("Status", "grey")  # Greyed-out style
+
+
+def schedule_status(text, fg):
+    """Record a status update and draw it shortly, along with any that follow it."""
+    _pending_status["text"] = text
+    _pending_status["fg"] = fg
+    if not _pending_status["scheduled"]:
+        _pending_status["scheduled"] = True
+        root.after(STATUS_FLUSH_MS, flush_status)
+
+
+def flush_status():
+    """Draw the latest pending status update."""
+    _pending_status["scheduled"] = False
+    progress_label.config(text=_pending_status["text"], fg=_pending_status["fg"])
+
+
+def compile_prompt_template(template):
+    """
+    Split a str.format template into literal text and placeholders once, returning
+    a function that fills it in by joining the pieces instead of re-parsing it.
+    """
+    parts = []
+    placeholders = []  # (index into parts, field name)
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if literal:
+            parts.append(literal)
+        if field_name is None:
+            continue
+        if format_spec or conversion or not field_name.isidentifier():
+            # Anything beyond plain {name} fields keeps the full str.format behavior
+            return template.format
+        placeholders.append((len(parts), field_name))
+        parts.append(None)
+
+    def fill_template(**values):
+        filled = parts.copy()
+        for index, field_name in placeholders:
+            filled[index] = str(values[field_name])
+        return "".join(filled)
+
+    return fill_template
+
+
+def get_prompt_filler():
+    """Return the compiled prompt.txt template, recompiling it only when the file changes."""
+    mtime = os.stat(PROMPT_FILE).st_mtime
+    if _prompt_cache["fill"] is None or mtime != _prompt_cache["mtime"]:
+        with open(PROMPT_FILE, "r", encoding="utf-8") as f:
+            _prompt_cache["fill"] = compile_prompt_template(f.read())
+        _prompt_cache["mtime"] = mtime
+    return _prompt_cache["fill"]
 
 
 def generate_prompt():
@@ -1100,21 +1735,20 @@ def generate_prompt():
 
         # Read the prompt template
         try:
-            with open("prompt.txt", "r", encoding="utf-8") as f:
-                prompt_template = f.read()
+            fill_prompt = get_prompt_filler()
         except FileNotFoundError:
             messagebox.showerror("Error", "prompt.txt file not found")
             return
 
         # Fill in the placeholders
-        filled_prompt = prompt_template.format(
+        filled_prompt = fill_prompt(
             short_description=short_desc, detailed_description=detailed_desc
         )
 
         # Open a new window to display the generated prompt
         prompt_window = tk.Toplevel(root)
         prompt_window.title("Generated Prompt")
-        prompt_window.geometry("500x400")
+        prompt_window.geometry(PROMPT_GEOMETRY)
 
         # Configure grid layout
         prompt_window.rowconfigure(0, weight=1)
@@ -1129,8 +1763,7 @@ def generate_prompt():
 
         # Copy to clipboard function
         def copy_to_clipboard():
-            root.clipboard_clear()
-            root.clipboard_append(filled_prompt)
+            set_clipboard(filled_prompt)
             messagebox.showinfo("Copied", "Prompt copied to clipboard!")
 
         # Button frame
@@ -1138,42 +1771,81 @@ def generate_prompt():
         button_frame.grid(row=1, column=0, sticky="ew", pady=10)
 
         # Copy and Close buttons
-        copy_button = tk.Button(button_frame, text="Copy to Clipboard", command=copy_to_clipboard)
+        copy_button = tk.Button(
+            button_frame, text="Copy to Clipboard", command=copy_to_clipboard, font=DEFAULT_FONT
+        )
         copy_button.pack(side="left", expand=True, padx=5)
 
-        close_button = tk.Button(button_frame, text="Close", command=prompt_window.destroy)
+        close_button = tk.Button(
+            button_frame, text="Close", command=prompt_window.destroy, font=DEFAULT_FONT
+        )
         close_button.pack(side="right", expand=True, padx=5)
 
     # Create the prompt generation window
     prompt_gen_window = tk.Toplevel(root)
     prompt_gen_window.title("Generate Script Prompt")
-    prompt_gen_window.geometry("500x400")
+    prompt_gen_window.geometry(PROMPT_GEOMETRY)
+
+    # Children go into a container that is packed only once they all exist, so the
+    # window is laid out in a single pass
+    container = tk.Frame(prompt_gen_window)
+    container.columnconfigure(0, weight=1)
 
     # Short description input
-    tk.Label(prompt_gen_window, text="Enter a one-line description of the task:").pack(
-        anchor="w", padx=10, pady=(10, 0)
+    tk.Label(container, text="Enter a one-line description of the task:", font=DEFAULT_FONT).grid(
+        row=0, column=0, sticky="w", padx=10, pady=(10, 0)
     )
-    short_description = tk.Entry(prompt_gen_window, width=60)
-    short_description.pack(padx=10, pady=5, fill="x")
+    short_description = tk.Entry(container, width=60)
+    short_description.grid(row=1, column=0, sticky="ew", padx=10, pady=5)
 
     # Detailed description input
-    tk.Label(prompt_gen_window, text="Enter a detailed description of the task:").pack(
-        anchor="w", padx=10, pady=(10, 0)
+    tk.Label(container, text="Enter a detailed description of the task:", font=DEFAULT_FONT).grid(
+        row=2, column=0, sticky="w", padx=10, pady=(10, 0)
     )
-    detailed_description = tk.Text(prompt_gen_window, wrap=tk.WORD, height=10)
-    detailed_description.pack(padx=10, pady=5, fill="x")
+    detailed_description = tk.Text(container, wrap=tk.WORD, height=10)
+    detailed_description.grid(row=3, column=0, sticky="ew", padx=10, pady=5)
 
     # Generate button
     generate_button = tk.Button(
-        prompt_gen_window, text="Generate Prompt", command=generate_prompt_text
+        container, text="Generate Prompt", command=generate_prompt_text, font=DEFAULT_FONT
     )
-    generate_button.pack(pady=10)
+    generate_button.grid(row=4, column=0, pady=10)
+
+    container.pack(fill="both", expand=True)
 
 
 # Main Application
 root = tk.Tk()
 root.title("Script Manager")
 
+# Shared fonts, created once since each Font registers a named Tk font
+HEADER_FONT = tkfont.Font(weight="bold")
+ITALIC_FONT = tkfont.Font(slant="italic")
+# Labels and buttons are given the default font explicitly rather than looking it up each time
+DEFAULT_FONT = tkfont.nametofont("TkDefaultFont")
+
+# Context menu shared by every script row; show_context_menu sets the script it acts on
+CONTEXT_MENU = tk.Menu(root, tearoff=0)
+CONTEXT_MENU.add_command(
+    label="Rebuild Env",
+    command=lambda: rebuild_venv(_active_script, run_buttons[_active_script]),
+)
+CONTEXT_MENU.add_command(label="Archive Script", command=lambda: archive_script(_active_script))
+CONTEXT_MENU.add_command(
+    label="Modify Requirements", command=lambda: modify_requirements(_active_script)
+)
+CONTEXT_MENU.add_command(label="Modify Script", command=lambda: modify_script(_active_script))
+CONTEXT_MENU.add_command(
+    label="Edit .env Variables", command=lambda: edit_env_variables(_active_script)
+)
+CONTEXT_MENU.add_command(
+    label="Run as Administrator", command=lambda: run_script_admin(_active_script)
+)
+
+# Make sure a pending metadata write is not lost when the app closes
+root.protocol("WM_DELETE_WINDOW", close_app)
+atexit.register(flush_metadata)
+
 # Layout
 frame = tk.Frame(root)
 frame.pack(fill="both", expand=True, padx=10, pady=10)
@@ -1181,24 +1853,40 @@ frame.pack(fill="both", expand=True, padx=10, pady=10)
 list_frame = tk.Frame(frame)
 list_frame.pack(fill="both", expand=True)
 
+# Scripts header; script rows are packed below it by update_script_list
+header_label = tk.Label(list_frame, text="Scripts", font=HEADER_FONT)
+header_label.pack(fill="x", pady=(0, 5))
+
 # Button Frame
 btn_frame = tk.Frame(root)
 btn_frame.pack(fill="x", pady=5)
 
 # Add Script Button
-btn_add = tk.Button(btn_frame, text="Add Script", command=add_script)
+btn_add = tk.Button(btn_frame, text="Add Script", command=add_script, font=DEFAULT_FONT)
 btn_add.pack(side="left", padx=5)
 
 # Modify the existing button frame creation to add the new button
-btn_generate_prompt = tk.Button(btn_frame, text="Generate Prompt", command=generate_prompt)
+btn_generate_prompt = tk.Button(
+    btn_frame, text="Generate Prompt", command=generate_prompt, font=DEFAULT_FONT
+)
 btn_generate_prompt.pack(side="left", padx=5)
 
 # Refresh Script List Button
-btn_refresh = tk.Button(btn_frame, text="Refresh Script List", command=update_script_list)
+btn_refresh = tk.Button(
+    btn_frame, text="Refresh Script List", command=update_script_list, font=DEFAULT_FONT
+)
 btn_refresh.pack(side="left", padx=5)
 
+# Set Up Missing Envs Button
+btn_setup_missing = tk.Button(
+    btn_frame, text="Set Up Missing Envs", command=setup_missing_venvs, font=DEFAULT_FONT
+)
+btn_setup_missing.pack(side="left", padx=5)
+
 # Update app Button
-btn_check_updates = tk.Button(btn_frame, text="Check for Updates", command=check_for_updates)
+btn_check_updates = tk.Button(
+    btn_frame, text="Check for Updates", command=check_for_updates, font=DEFAULT_FONT
+)
 btn_check_updates.pack(side="left", padx=5)
 
 # Progress Label Frame
@@ -1206,8 +1894,7 @@ progress_frame = tk.Frame(root, relief="solid", borderwidth=1, padx=10, pady=5)
 progress_frame.pack(fill="x", pady=5, padx=10)
 
 # Progress Label with placeholder text in italics
-italic_font = tkfont.Font(slant="italic")  # Define an italic font
-progress_label = tk.Label(progress_frame, font=italic_font, anchor="w")
+progress_label = tk.Label(progress_frame, font=ITALIC_FONT, anchor="w")
 progress_label.pack(fill="x")
 
 # Capture the default foreground color after the label is created
@@ -1215,8 +1902,11 @@ default_fg_color = progress_label.cget("fg")
 
 reset_status()
 
-# Initialize script list
-update_script_list()
+# Start the loop delivering background workers' UI updates
+drain_ui_queue()
+
+# Initialize the script list once the window is up, keeping the scan off the first paint
+root.after_idle(update_script_list)
 
 # Start the app
 root.mainloop()